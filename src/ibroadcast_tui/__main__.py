@@ -1,5 +1,13 @@
 """Main entry point for running the package."""
 
+try:
+    # Optional: libuv-backed event loop cuts per-callback overhead for the
+    # many small UI/IO callbacks Textual schedules. Unavailable on Windows.
+    import uvloop  # type: ignore[import-not-found]
+    uvloop.install()
+except ImportError:
+    pass
+
 from .ui.app import iBroadcastTUI
 
 if __name__ == "__main__":
@@ -1,7 +1,25 @@
 """API client for iBroadcast service."""
 
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit
+
 import httpx
-from typing import Optional, Dict, Any
+
+try:
+    # Optional: file-backed HTTP cache so warm launches serve the multi-MB
+    # library response from disk instead of re-downloading it.
+    import hishel  # type: ignore[import-not-found]
+except ImportError:
+    hishel = None  # type: ignore[assignment]
+
+try:
+    # Optional: C-accelerated decoding; the library payload is the largest
+    # JSON body the app ever parses.
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from ..config.settings import settings
 from ..config.token_manager import token_manager
@@ -23,11 +41,55 @@ class iBroadcastClient:
             "User-Agent": f"{settings.app_name} {settings.app_version}",
         }
 
-        self.client = httpx.Client(base_url=self.base_url, headers=headers)
+        # One persistent client for all requests; keep-alive avoids a fresh
+        # TCP+TLS handshake for each back-to-back call. The pool holds idle
+        # connections to both the api and library hosts.
+        self.client = httpx.Client(
+            base_url=self.base_url,
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+            mounts=self._build_cache_mounts(),
+        )
 
         # Try to load stored session
         self._load_stored_session()
+
+    @staticmethod
+    def _build_cache_mounts() -> Dict[str, httpx.BaseTransport]:
+        """Mount a disk-backed caching transport for the library host only.
+
+        The library responses change rarely between sessions; an hour of
+        file-backed caching turns warm starts into a local read. Auth
+        responses must never be replayed from disk — a cached login would
+        keep resurrecting an expired token after a 401 — so the cache is
+        mounted for the library host alone and every other request uses
+        httpx's default transport. Without hishel (or with
+        IBROADCAST_HTTP_CACHE=false) no mount is installed.
+        """
+        if hishel is None or not settings.http_cache:
+            return {}
+        # Same restrictive permissions as the token and snapshot files;
+        # cached bodies carry the library token.
+        base_dir = Path.home() / ".ibroadcast-tui"
+        base_dir.mkdir(mode=0o700, exist_ok=True)
+        cache_dir = base_dir / "http-cache"
+        cache_dir.mkdir(mode=0o700, exist_ok=True)
+        storage = hishel.FileStorage(base_path=cache_dir, ttl=3600)
+        controller = hishel.Controller(
+            cacheable_methods=["GET", "POST"], allow_heuristics=True
+        )
+        transport = hishel.CacheTransport(
+            transport=httpx.HTTPTransport(), storage=storage, controller=controller
+        )
+        return {f"all://{urlsplit(settings.library_url).netloc}": transport}
     
+    @staticmethod
+    def _parse_json(response: httpx.Response) -> Any:
+        """Decode a JSON response body, via orjson when available."""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
     def _load_stored_session(self) -> None:
         """Load and validate stored session."""
         # For now, we'll implement session storage later
@@ -53,7 +115,7 @@ class iBroadcastClient:
             response = self.client.post("/s/JSON/status", json=login_data)
             response.raise_for_status()
 
-            status_data = response.json()
+            status_data = self._parse_json(response)
 
             if "user" not in status_data:
                 return {"status": "error", "message": "Invalid login credentials"}
@@ -123,8 +185,13 @@ class iBroadcastClient:
         
         return {"status": "success", "endpoints": discovered_endpoints}
     
-    def get_library(self) -> Dict[str, Any]:
-        """Get user's music library."""
+    def get_library(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get user's music library.
+
+        With force_refresh the request skips the hishel cache mount, so an
+        explicit reload always hits the network instead of replaying a
+        response cached within the last hour.
+        """
         # Ensure we have a valid session
         if not self.user_id or not self.token:
             auth_result = self.authenticate()
@@ -142,10 +209,17 @@ class iBroadcastClient:
                 "supported_types": False,
             }
 
-            response = httpx.post(f"{self.library_url}/s/JSON/library", json=library_data)
+            # Absolute URL overrides the client's base_url; reusing the pooled
+            # client keeps the library connection alive between calls.
+            extensions = {"cache_disabled": True} if force_refresh else None
+            response = self.client.post(
+                f"{self.library_url}/s/JSON/library",
+                json=library_data,
+                extensions=extensions,
+            )
             response.raise_for_status()
 
-            library_response = response.json()
+            library_response = self._parse_json(response)
 
             if "library" in library_response:
                 return {"status": "success", "data": library_response["library"]}
@@ -163,6 +237,25 @@ class iBroadcastClient:
         except Exception as e:
             return {"status": "error", "message": f"Failed to fetch library: {e}"}
 
+    def get_stream_urls(self, tracks: List[Tuple[str, str]]) -> List[str]:
+        """Build signed streaming URLs for (track_id, file_path) pairs.
+
+        The expiry and signature query string is computed once and shared
+        by every URL, so pre-warming a whole playlist costs a single
+        time() call plus one f-string per track.
+        """
+        expires = int(time.time()) + 3600
+        signature = f"Expires={expires}&Signature={self.token}&user_id={self.user_id}"
+        base = settings.streaming_url
+        return [
+            f"{base}{file_path}?{signature}&file_id={track_id}"
+            for track_id, file_path in tracks
+        ]
+
+    def get_stream_url(self, track_id: str, file_path: str) -> str:
+        """Build the signed streaming URL for a single track."""
+        return self.get_stream_urls([(track_id, file_path)])[0]
+
     def close(self) -> None:
         """Close the HTTP client."""
         self.client.close()
\ No newline at end of file
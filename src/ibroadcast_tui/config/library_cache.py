@@ -0,0 +1,72 @@
+"""On-disk snapshot cache for the parsed iBroadcast library."""
+
+import mmap
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from .settings import settings
+
+class LibraryCache:
+    """Persists the parsed library so warm starts skip download and parse."""
+
+    def __init__(self) -> None:
+        """Initialize the cache paths."""
+        self.cache_dir = Path.home() / ".ibroadcast-tui"
+        self.cache_file = self.cache_dir / "library.pickle"
+
+    def save(self, library: Dict[str, Any]) -> None:
+        """Write the library as a pickle snapshot keyed to the current user."""
+        try:
+            self.cache_dir.mkdir(mode=0o700, exist_ok=True)
+            payload = pickle.dumps(
+                {"username": settings.username, "library": library}, protocol=5
+            )
+            # Write to a temporary file first, then move to avoid partial
+            # writes. The name carries pid and thread id because concurrent
+            # workers (auth and library groups) may snapshot at once; a
+            # shared temp path would interleave their writes.
+            temp_file = self.cache_file.with_suffix(
+                f".{os.getpid()}-{threading.get_ident()}.tmp"
+            )
+            temp_file.write_bytes(payload)
+            temp_file.replace(self.cache_file)
+            self.cache_file.chmod(0o600)
+        except (OSError, pickle.PicklingError):
+            pass  # A failed snapshot only costs the next warm start
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Read the snapshot back, or None if absent, corrupt, or another user's.
+
+        The file is memory-mapped so unpickling reads straight from the page
+        cache without an intermediate bytes copy.
+        """
+        if not self.cache_file.exists():
+            return None
+        try:
+            with open(self.cache_file, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    snapshot = pickle.loads(buf)
+        except Exception:
+            # A corrupt pickle can raise nearly anything (unresolvable
+            # globals surface as ModuleNotFoundError/AttributeError); a bad
+            # snapshot must never take the app down, so drop it and refetch.
+            self.delete()
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("username") != settings.username:
+            return None
+        library = snapshot.get("library")
+        return library if isinstance(library, dict) else None
+
+    def delete(self) -> None:
+        """Delete the snapshot file."""
+        try:
+            if self.cache_file.exists():
+                self.cache_file.unlink()
+        except OSError:
+            pass  # Ignore deletion errors
+
+# Global library cache instance
+library_cache = LibraryCache()
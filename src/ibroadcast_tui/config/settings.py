@@ -15,6 +15,7 @@ class Settings:
         """Initialize settings from environment variables."""
         self.api_url: str = os.getenv("IBROADCAST_API_URL", "https://api.ibroadcast.com")
         self.library_url: str = os.getenv("IBROADCAST_LIBRARY_URL", "https://library.ibroadcast.com")
+        self.streaming_url: str = os.getenv("IBROADCAST_STREAMING_URL", "https://streaming.ibroadcast.com")
         self.username: Optional[str] = os.getenv("IBROADCAST_USERNAME")
         self.password: Optional[str] = os.getenv("IBROADCAST_PASSWORD")
 
@@ -22,6 +23,8 @@ class Settings:
         self.app_name: str = "iBroadcast TUI"
         self.app_version: str = "0.1.0"
         self.debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+        # Opt-out switch for the on-disk HTTP cache
+        self.http_cache: bool = os.getenv("IBROADCAST_HTTP_CACHE", "true").lower() == "true"
 
     def validate(self) -> bool:
         """Validate that required settings are present and not placeholder values."""
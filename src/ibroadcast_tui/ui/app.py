@@ -1,148 +1,652 @@
 """Main UI application for iBroadcast TUI."""
 
+import sys
+from collections import Counter
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from textual import work
 from textual.app import App, ComposeResult
+from textual.notifications import SeverityLevel
 from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import Header, Footer, Static, Button, ListView, ListItem, Label
+from textual.widgets import (
+    Header,
+    Footer,
+    Static,
+    Button,
+    ListView,
+    ListItem,
+    Label,
+    DataTable,
+)
 
 from ..api.client import iBroadcastClient
+from ..config.library_cache import library_cache
 from ..config.settings import settings
 
+# Sidebar entries are fixed; keep them in one place instead of re-listing
+# them inline every time compose runs. Lowercased they double as view names.
+_SIDEBAR_ITEMS = ("Tracks", "Albums", "Artists", "Playlists")
+
+# Only this many rows are inserted into the DataTable at a time; the window
+# slides as the cursor approaches an edge, keeping focus changes and cell
+# measurement O(window) instead of O(library).
+_ROW_WINDOW = 200
+_WINDOW_MARGIN = 20
+
+# m:ss strings for every length up to an hour, built once at import; the
+# tracks view then formats the common case with a plain index instead of
+# f-string machinery per row.
+_DURATIONS: Tuple[str, ...] = tuple(f"{i // 60}:{i % 60:02d}" for i in range(3601))
+
+# Column labels per view; a dict lookup replaces a branch chain on the
+# compose/switch hot path.
+_VIEW_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "tracks": ("Title", "Artist", "Duration"),
+    "albums": ("Album", "Artist", "Tracks"),
+    "artists": ("Artist", "Tracks"),
+    "playlists": ("Playlist", "Tracks"),
+}
+
 class iBroadcastTUI(App):
     """Main TUI application for iBroadcast."""
-    
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-    
-    .main-container {
-        height: 100%;
-    }
-    
-    .sidebar {
-        width: 25%;
-        border-right: solid $primary;
-    }
-    
-    .content {
-        width: 75%;
-    }
-    
-    .welcome {
-        text-align: center;
-        padding: 1;
-    }
-    """
-    
+
+    CSS_PATH = "app.tcss"
+
+    BINDINGS = [("r", "reload_library", "Reload")]
+
     def __init__(self) -> None:
         """Initialize the TUI application."""
         super().__init__()
         self.api_client = iBroadcastClient()
         self.title = settings.app_name
-    
+        # Validate settings once; re-validate explicitly via refresh_settings()
+        self._settings_valid: bool = settings.validate()
+        self.library_data: Optional[Dict[str, Any]] = None
+        self.current_view: str = "tracks"
+        self._status_text: str = "Welcome to iBroadcast TUI"
+        # Prepared row tuples per view; invalidated when library_data is
+        # reassigned so view switches don't re-sort and rebuild rows.
+        self._view_cache: Dict[str, list] = {}
+        # Flat artist id -> name map built once per library load so the row
+        # loops do a single dict.get instead of nested lookups and shape
+        # checks.
+        self._artist_name_by_id: Dict[str, str] = {}
+        # Uniform (lowercase_name, id, ...fields) tuples per section, sorted
+        # once per library load; all shape dispatch happens at build time.
+        self._sorted_entries: Dict[str, list] = {}
+        # Section totals computed once per load for headers.
+        self._counts: Dict[str, int] = {}
+        # First library row currently inserted in the DataTable.
+        self._window_start: int = 0
+        # Cursor row expected after a window slide; highlight events are
+        # ignored until it arrives so clear()'s cursor reset can't bounce
+        # the window straight back.
+        self._pending_cursor: Optional[int] = None
+        # Widgets updated on every status change, resolved once on mount so
+        # updates skip the widget-tree walk query_one performs.
+        self._status_widget: Optional[Static] = None
+        self._view_header_widget: Optional[Static] = None
+        self._table: Optional[DataTable] = None
+        # Library id of the last row the user selected, if any.
+        self._selected_id: Optional[str] = None
+        # Button id -> action; a dict lookup keeps click dispatch O(1) as
+        # buttons are added instead of growing an if/elif chain.
+        self._button_actions = {
+            "connect-btn": self.connect_to_service,
+            "discover-btn": self.discover_endpoints,
+        }
+
+    def refresh_settings(self) -> None:
+        """Re-validate settings after a configuration change."""
+        self._settings_valid = settings.validate()
+
     def compose(self) -> ComposeResult:
         """Create the main layout."""
         yield Header()
-        
+
         with Container(classes="main-container"):
             with Horizontal():
                 with Vertical(classes="sidebar"):
                     yield Static("Library", id="sidebar-title")
                     yield ListView(
-                        ListItem(Label("Tracks")),
-                        ListItem(Label("Playlists")),
-                        ListItem(Label("Albums")),
-                        ListItem(Label("Settings")),
+                        *(ListItem(Label(item)) for item in _SIDEBAR_ITEMS),
                         id="sidebar-nav"
                     )
-                
-                with Vertical(classes="content"):
-                    yield Static("Welcome to iBroadcast TUI", id="welcome")
+
+                with Vertical(classes="content", id="content-container"):
+                    yield Static(self._status_text, id="welcome")
                     yield Button("Connect to iBroadcast", id="connect-btn")
                     yield Button("Discover API Endpoints", id="discover-btn")
-        
+                    yield Static(self._view_header_text(), classes="view-header")
+                    yield self._create_datatable_view()
+
         yield Footer()
-    
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
-        if event.button.id == "connect-btn":
-            self.connect_to_service()
-        elif event.button.id == "discover-btn":
-            self.discover_endpoints()
-    
+        button_id = event.button.id
+        if button_id is None:
+            return
+        action = self._button_actions.get(button_id)
+        if action is not None:
+            action()
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """Switch the library view from the sidebar selection."""
+        index = event.list_view.index
+        if index is not None and 0 <= index < len(_SIDEBAR_ITEMS):
+            self.switch_view(_SIDEBAR_ITEMS[index].lower())
+
+    def switch_view(self, view: str) -> None:
+        """Switch the content area to another library view."""
+        if view == self.current_view:
+            return
+        self.current_view = view
+        self._refresh_table()
+
+    def _refresh_table(self) -> None:
+        """Repopulate the table and header for the current view in place.
+
+        Swapping the existing DataTable's columns and rows is an order of
+        magnitude cheaper than recomposing the whole widget tree.
+        """
+        self._window_start = 0
+        self._pending_cursor = None
+        table = self._table if self._table is not None else self.query_one("#library-table", DataTable)
+        table.clear(columns=True)
+        table.add_columns(*self._columns_for_view(self.current_view))
+        table.add_rows(self._prepare_view_data()[:_ROW_WINDOW])
+        if self._view_header_widget is not None:
+            self._view_header_widget.update(self._view_header_text())
+
     def connect_to_service(self) -> None:
         """Connect to iBroadcast service."""
-        if not settings.validate():
+        if not self._settings_valid:
             self.notify("Please configure username and password in .env file", severity="error")
             return
 
-        try:
-            # Show authenticating message
-            self.notify("Authenticating with iBroadcast...", severity="information")
+        # Show authenticating message; the network round-trip happens in a
+        # worker thread so the event loop keeps pumping.
+        self.notify("Authenticating with iBroadcast...", severity="information")
+        self._do_connect()
+
+    @work(exclusive=True, thread=True, group="auth")
+    def _do_connect(self) -> None:
+        """Authenticate and fetch the library in one worker pass.
 
+        The library fetch depends on the auth token, so the two calls
+        cannot overlap — but running them back-to-back on this thread
+        starts the fetch immediately instead of bouncing through the UI
+        event queue and a second worker spin-up.
+        """
+        try:
             result = self.api_client.authenticate()
-            if result["status"] == "success":
-                self.notify(f"Connected to iBroadcast! {result['message']}", severity="information")
-                # Try to fetch library to show we have real data
-                self._load_library()
-            else:
-                self.notify(f"Authentication failed: {result['message']}", severity="error")
         except Exception as e:
-            self.notify(f"Connection failed: {e}", severity="error")
-    
+            self.call_from_thread(self.notify, f"Connection failed: {e}", severity="error")
+            return
+        if result["status"] != "success":
+            self.call_from_thread(
+                self.notify, f"Authentication failed: {result['message']}", severity="error"
+            )
+            return
+        self.call_from_thread(
+            self.notify, f"Connected to iBroadcast! {result['message']}", severity="information"
+        )
+        self._fetch_and_apply_library()
+
+    def _notify_batch(self, lines: List[str], severity: SeverityLevel = "information") -> None:
+        """Emit several related messages as a single toast.
+
+        Each notify mounts a toast widget and triggers a re-render, so
+        adjacent messages are coalesced instead of queued back-to-back.
+        """
+        if lines:
+            self.notify("\n".join(lines), severity=severity)
+
     def discover_endpoints(self) -> None:
         """Discover and display API endpoints."""
+        self.notify("Discovering iBroadcast API endpoints...", severity="information")
+        self._do_discover()
+
+    @work(exclusive=True, thread=True, group="discover")
+    def _do_discover(self) -> None:
+        """Probe API endpoints off the UI thread."""
         try:
-            self.notify("Discovering iBroadcast API endpoints...", severity="information")
             result = self.api_client._discover_api_endpoints()
-            if result["status"] == "success":
-                endpoints = result["endpoints"]
-                available_endpoints = [ep for ep, info in endpoints.items() if info.get("available")]
-                
-                if available_endpoints:
-                    self.notify(f"Working endpoints: {', '.join(available_endpoints)}", severity="information")
-                else:
-                    self.notify("No working endpoints found. Check API credentials.", severity="warning")
-                    
-                # Show all tested endpoints
-                tested_endpoints = list(endpoints.keys())
-                self.notify(f"Tested endpoints: {', '.join(tested_endpoints)}", severity="information")
-            else:
-                self.notify(f"Endpoint discovery failed: {result.get('message', 'Unknown error')}", severity="error")
         except Exception as e:
-            self.notify(f"Endpoint discovery failed: {e}", severity="error")
-    
-    def _load_library(self) -> None:
-        """Load and display library information."""
+            self.call_from_thread(self.notify, f"Endpoint discovery failed: {e}", severity="error")
+            return
+        self.call_from_thread(self._on_discover_result, result)
+
+    def _on_discover_result(self, result: Dict[str, Any]) -> None:
+        """Display endpoint discovery results on the UI thread."""
+        if result["status"] == "success":
+            endpoints = result["endpoints"]
+            available_endpoints = [ep for ep, info in endpoints.items() if info.get("available")]
+
+            messages = []
+            if available_endpoints:
+                messages.append(f"Working endpoints: {', '.join(available_endpoints)}")
+            else:
+                messages.append("No working endpoints found. Check API credentials.")
+            messages.append(f"Tested endpoints: {', '.join(endpoints.keys())}")
+            self._notify_batch(
+                messages,
+                severity="information" if available_endpoints else "warning",
+            )
+        else:
+            self.notify(f"Endpoint discovery failed: {result.get('message', 'Unknown error')}", severity="error")
+
+    @staticmethod
+    def _normalize_library(library: Dict[str, Any]) -> None:
+        """Stringify ids in one pass so render loops skip per-row str() casts.
+
+        Section keys and the artist-id fields referenced by the track and
+        album rows are normalized to str immediately after a load; every
+        later lookup is then a plain dict.get with no coercion.
+        """
+        for section in ("tracks", "albums", "artists", "playlists"):
+            entries = library.get(section)
+            if isinstance(entries, dict):
+                library[section] = {str(k): v for k, v in entries.items()}
+        # Interning the artist-id strings collapses the thousands of str()
+        # copies (one per track) to one object per artist, so the name-map
+        # lookups get pointer-equal keys and the heap stays small.
+        for track in library.get("tracks", {}).values():
+            if isinstance(track, list) and len(track) > 7:
+                track[7] = sys.intern(str(track[7]))
+            elif isinstance(track, dict) and "artist_id" in track:
+                track["artist_id"] = sys.intern(str(track["artist_id"]))
+        for album in library.get("albums", {}).values():
+            if isinstance(album, list) and len(album) > 2:
+                album[2] = sys.intern(str(album[2]))
+            elif isinstance(album, dict) and "artist_id" in album:
+                album["artist_id"] = sys.intern(str(album["artist_id"]))
+
+    @staticmethod
+    def _build_sorted_entries(
+        lib: Dict[str, Any], artist_track_counts: Dict[str, int]
+    ) -> Dict[str, list]:
+        """Flatten each section into uniform, pre-sorted field tuples.
+
+        All shape dispatch (list- vs dict-form rows) happens here once per
+        load; the _prepare_* methods then run straight comprehensions over
+        already-sorted homogeneous tuples.
+        """
+
+        tracks = []
+        for track_id, track in lib.get("tracks", {}).items():
+            if isinstance(track, dict):
+                title = str(track.get("title", "Unknown Track"))
+                artist_id = track.get("artist_id")
+                length = track.get("length")
+            else:
+                try:
+                    title = str(track[2])
+                    length = track[4]
+                    artist_id = track[7]
+                except (TypeError, IndexError, KeyError):
+                    continue
+            try:
+                length = int(length) if length is not None else 0
+            except (TypeError, ValueError):
+                length = 0
+            tracks.append((title.lower(), track_id, title, artist_id, length))
+        tracks.sort()
+
+        albums = []
+        for album_id, album in lib.get("albums", {}).items():
+            if isinstance(album, dict):
+                name = str(album.get("name", "Unknown Album"))
+                track_ids = album.get("tracks", [])
+                artist_id = album.get("artist_id")
+            else:
+                try:
+                    name = str(album[0])
+                    track_ids = album[1]
+                    artist_id = album[2]
+                except (TypeError, IndexError, KeyError):
+                    continue
+            track_count = len(track_ids) if isinstance(track_ids, list) else 0
+            albums.append((name.lower(), album_id, name, artist_id, track_count))
+        albums.sort()
+
+        artists = []
+        for artist_id, artist in lib.get("artists", {}).items():
+            if isinstance(artist, dict):
+                name = str(artist.get("name", "Unknown Artist"))
+                track_ids = artist.get("tracks")
+            else:
+                try:
+                    name = str(artist[0])
+                    track_ids = artist[1]
+                except (TypeError, IndexError, KeyError):
+                    continue
+            if isinstance(track_ids, list):
+                track_count = len(track_ids)
+            else:
+                # No track list on the entry; use the per-load tally
+                track_count = artist_track_counts.get(artist_id, 0)
+            artists.append((name.lower(), artist_id, name, track_count))
+        artists.sort()
+
+        playlists = []
+        for playlist_id, playlist in lib.get("playlists", {}).items():
+            if isinstance(playlist, dict):
+                name = str(playlist.get("name", "Unknown Playlist"))
+                track_ids = playlist.get("tracks", [])
+            else:
+                try:
+                    name = str(playlist[0])
+                    track_ids = playlist[1]
+                except (TypeError, IndexError, KeyError):
+                    continue
+            track_count = len(track_ids) if isinstance(track_ids, list) else 0
+            playlists.append((name.lower(), playlist_id, name, track_count))
+        playlists.sort()
+
+        return {"tracks": tracks, "albums": albums, "artists": artists, "playlists": playlists}
+
+    @staticmethod
+    def _build_name_map(entries: Dict[str, Any]) -> Dict[str, str]:
+        """Flatten list- or dict-shaped library entries into an id -> name map."""
+        names: Dict[str, str] = {}
+        for entry_id, entry in entries.items():
+            if isinstance(entry, list) and entry:
+                names[entry_id] = sys.intern(str(entry[0]))
+            elif isinstance(entry, dict):
+                names[entry_id] = sys.intern(str(entry.get("name", "Unknown")))
+        return names
+
+    @staticmethod
+    def _build_artist_track_counts(library: Dict[str, Any]) -> Dict[str, int]:
+        """Tally tracks per artist in a single pass over the tracks section.
+
+        Sections are homogeneous in practice, so the shape is probed once
+        and a specialized loop runs with no per-track dispatch; a mixed or
+        malformed section falls back to the guarded path.
+        """
+        tracks = library.get("tracks", {})
+        if not tracks:
+            return {}
+        sample = next(iter(tracks.values()))
+        try:
+            if isinstance(sample, dict):
+                counts = Counter(track.get("artist_id") for track in tracks.values())
+            else:
+                counts = Counter(track[7] for track in tracks.values())
+        except (TypeError, KeyError, IndexError, AttributeError):
+            counts = Counter(
+                track[7] if isinstance(track, list) else track.get("artist_id")
+                for track in tracks.values()
+                if (isinstance(track, list) and len(track) > 7) or isinstance(track, dict)
+            )
+        counts.pop(None, None)
+        return counts
+
+    def _get_total_items_for_current_view(self) -> int:
+        """Total number of items in the current view's section.
+
+        Section sizes are tallied once per load into _counts, so this is a
+        single dict lookup rather than a branch chain plus len() per call.
+        """
+        return self._counts.get(self.current_view, 0)
+
+    def _view_header_text(self) -> str:
+        """Header line for the current view."""
+        return f"{self.current_view.title()} ({self._get_total_items_for_current_view()})"
+
+    @staticmethod
+    def _tracks_rows(entries: list, artist_names: Dict[str, str]) -> List[Tuple[str, str, str]]:
+        """Build (title, artist, duration) rows from sorted track entries.
+
+        Lengths are coerced to int at load; anything under an hour is a
+        straight index into the precomputed table.
+        """
+        return [
+            (
+                title,
+                artist_names.get(artist_id, "Unknown Artist"),
+                _DURATIONS[length] if 0 <= length < 3601 else f"{length // 60}:{length % 60:02d}",
+            )
+            for _, _, title, artist_id, length in entries
+        ]
+
+    @staticmethod
+    def _albums_rows(entries: list, artist_names: Dict[str, str]) -> List[Tuple[str, str, int]]:
+        """Build (album, artist, track count) rows from sorted album entries."""
+        return [
+            (name, artist_names.get(artist_id, "Unknown Artist"), track_count)
+            for _, _, name, artist_id, track_count in entries
+        ]
+
+    @staticmethod
+    def _named_count_rows(entries: list) -> List[Tuple[str, int]]:
+        """Build (name, track count) rows from sorted artist/playlist entries."""
+        return [(name, track_count) for _, _, name, track_count in entries]
+
+    @classmethod
+    def _build_view_rows(
+        cls, sorted_entries: Dict[str, list], artist_names: Dict[str, str]
+    ) -> Dict[str, list]:
+        """Materialize display rows for every view in one pass.
+
+        Runs in the library worker, so the first visit to each view is a
+        cache hit instead of a row build on the UI thread.
+        """
+        return {
+            "tracks": cls._tracks_rows(sorted_entries.get("tracks", []), artist_names),
+            "albums": cls._albums_rows(sorted_entries.get("albums", []), artist_names),
+            "artists": cls._named_count_rows(sorted_entries.get("artists", [])),
+            "playlists": cls._named_count_rows(sorted_entries.get("playlists", [])),
+        }
+
+    def _prepare_tracks_data(self) -> List[Tuple[str, str, str]]:
+        """Prepare (title, artist, duration) rows for the tracks view."""
+        if "tracks" in self._view_cache:
+            return self._view_cache["tracks"]
+        rows = self._tracks_rows(self._sorted_entries.get("tracks", []), self._artist_name_by_id)
+        self._view_cache["tracks"] = rows
+        return rows
+
+    def _prepare_albums_data(self) -> List[Tuple[str, str, int]]:
+        """Prepare (album, artist, track count) rows for the albums view."""
+        if "albums" in self._view_cache:
+            return self._view_cache["albums"]
+        rows = self._albums_rows(self._sorted_entries.get("albums", []), self._artist_name_by_id)
+        self._view_cache["albums"] = rows
+        return rows
+
+    def _prepare_artists_data(self) -> List[Tuple[str, int]]:
+        """Prepare (artist, track count) rows for the artists view."""
+        if "artists" in self._view_cache:
+            return self._view_cache["artists"]
+        rows = self._named_count_rows(self._sorted_entries.get("artists", []))
+        self._view_cache["artists"] = rows
+        return rows
+
+    def _prepare_playlists_data(self) -> List[Tuple[str, int]]:
+        """Prepare (playlist, track count) rows for the playlists view."""
+        if "playlists" in self._view_cache:
+            return self._view_cache["playlists"]
+        rows = self._named_count_rows(self._sorted_entries.get("playlists", []))
+        self._view_cache["playlists"] = rows
+        return rows
+
+    # View name -> unbound row preparer, resolved with one dict lookup
+    # instead of an if/elif chain per call; callers pass self explicitly.
+    _VIEW_PREPARERS: ClassVar[Dict[str, Callable[["iBroadcastTUI"], list]]] = {
+        "tracks": _prepare_tracks_data,
+        "albums": _prepare_albums_data,
+        "artists": _prepare_artists_data,
+        "playlists": _prepare_playlists_data,
+    }
+
+    def _prepare_view_data(self) -> list:
+        """Prepare the row data for the current view."""
+        prepare = self._VIEW_PREPARERS.get(self.current_view)
+        return prepare(self) if prepare is not None else []
+
+    def _columns_for_view(self, view: str) -> Tuple[str, ...]:
+        """Column labels for a library view."""
+        return _VIEW_COLUMNS.get(view, _VIEW_COLUMNS["playlists"])
+
+    def _create_datatable_view(self) -> DataTable:
+        """Create the DataTable for the current view."""
+        table: DataTable = DataTable(id="library-table")
+        table.cursor_type = "row"
+        table.add_columns(*self._columns_for_view(self.current_view))
+        self._window_start = 0
+        table.add_rows(self._prepare_view_data()[:_ROW_WINDOW])
+        return table
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Slide the visible row window when the cursor nears an edge."""
+        rows = self._prepare_view_data()
+        if len(rows) <= _ROW_WINDOW:
+            return
+        table = event.data_table
+        index = event.cursor_row
+        if self._pending_cursor is not None:
+            # Mid-slide: swallow the cursor reset from clear() and the
+            # repositioning event we queued ourselves.
+            if index == self._pending_cursor:
+                self._pending_cursor = None
+            return
+        global_row = self._window_start + index
+        at_bottom = (
+            index >= table.row_count - _WINDOW_MARGIN
+            and self._window_start + table.row_count < len(rows)
+        )
+        at_top = index < _WINDOW_MARGIN and self._window_start > 0
+        if not (at_bottom or at_top):
+            return
+        new_start = max(0, min(global_row - _ROW_WINDOW // 2, len(rows) - _ROW_WINDOW))
+        if new_start == self._window_start:
+            return
+        self._window_start = new_start
+        self._pending_cursor = global_row - new_start
+        table.clear()
+        table.add_rows(rows[new_start:new_start + _ROW_WINDOW])
+        table.move_cursor(row=global_row - new_start, animate=False)
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Resolve the selected row to its library entry in O(1).
+
+        The sorted entry tuples already carry the library id at index 1 in
+        row order, so a selection is a list index plus the window offset —
+        no re-sort or scan of the section.
+        """
+        entries = self._sorted_entries.get(self.current_view, [])
+        global_row = self._window_start + event.cursor_row
+        if not 0 <= global_row < len(entries):
+            return
+        entry = entries[global_row]
+        self._selected_id = entry[1]
+        self.notify(f"Selected {self.current_view[:-1]}: {entry[2]}", severity="information")
+
+    def action_reload_library(self) -> None:
+        """Re-fetch the library on demand."""
+        if not self._settings_valid:
+            self.notify("Please configure username and password in .env file", severity="error")
+            return
+        self.notify("Reloading library...", severity="information")
+        # An explicit reload must bypass the HTTP cache, or it could just
+        # replay the response it is trying to refresh.
+        self._load_library(force=True)
+
+    @work(exclusive=True, thread=True, group="library")
+    def _load_library(self, force: bool = False) -> None:
+        """Fetch the library and build its indices off the UI thread."""
+        self._fetch_and_apply_library(force)
+
+    def _fetch_and_apply_library(self, force: bool = False) -> None:
+        """Fetch, index and apply the library; runs on a worker thread."""
         try:
-            self.notify("Discovering iBroadcast API endpoints...", severity="information")
-            result = self.api_client.get_library()
+            result = self.api_client.get_library(force_refresh=force)
+            indices = None
             if result["status"] == "success":
-                endpoint = result.get("endpoint", "unknown")
                 data = result.get("data", {})
-                
-                # Show success with endpoint info
-                if isinstance(data, dict) and data:
-                    data_keys = list(data.keys())[:5]  # Show first 5 keys
-                    self.notify(f"Connected! Using endpoint: {endpoint}. Data keys: {', '.join(data_keys)}", severity="information")
-                else:
-                    self.notify(f"Connected! Using endpoint: {endpoint}. No data structure available Yet.", severity="information")
-            else:
-                message = result.get("message", "Unknown error")
-                self.notify(f"Failed to load library: {message}", severity="error")
-                
-                # Show discovery info if available
-                if "discovered" in result:
-                    discovery = result["discovered"]
-                    if discovery.get("status") == "success":
-                        available_endpoints = [ep for ep, info in discovery["endpoints"].items() if info.get("available")]
-                        if available_endpoints:
-                            self.notify(f"Available endpoints found: {', '.join(available_endpoints)}", severity="information")
-                        
+                indices = self._build_indices(data if isinstance(data, dict) else {})
+                # Snapshot for the next launch while still off the UI thread
+                library_cache.save(indices["library_data"])
         except Exception as e:
-            self.notify(f"Library loading failed: {e}", severity="error")
-    
+            self.call_from_thread(self.notify, f"Library loading failed: {e}", severity="error")
+            return
+        self.call_from_thread(self._apply_library, result, indices)
+
+    @work(exclusive=True, thread=True, group="library")
+    def _load_snapshot(self) -> None:
+        """Warm-start from the on-disk snapshot, if one matches this user."""
+        library = library_cache.load()
+        if library is None:
+            return
+        indices = self._build_indices(library)
+        self.call_from_thread(self._apply_library, {"status": "success", "data": library}, indices)
+
+    @classmethod
+    def _build_indices(cls, library: Dict[str, Any]) -> Dict[str, Any]:
+        """Build every per-load index for a fetched library.
+
+        Pure CPU work with no UI calls, so the library worker thread can run
+        it while the event loop keeps painting; the result is handed to
+        _apply_library for plain attribute assignment.
+        """
+        cls._normalize_library(library)
+        artist_track_counts = cls._build_artist_track_counts(library)
+        artist_names = cls._build_name_map(library.get("artists", {}))
+        sorted_entries = cls._build_sorted_entries(library, artist_track_counts)
+        return {
+            "library_data": library,
+            "artist_name_by_id": artist_names,
+            "sorted_entries": sorted_entries,
+            "view_cache": cls._build_view_rows(sorted_entries, artist_names),
+            "counts": {
+                section: len(library.get(section, {}))
+                for section in ("tracks", "albums", "artists", "playlists")
+            },
+        }
+
+    def _apply_library(self, result: Dict[str, Any], indices: Optional[Dict[str, Any]]) -> None:
+        """Apply a fetched library result and its prebuilt indices to the UI."""
+        if result["status"] == "success" and indices is not None:
+            self.library_data = indices["library_data"]
+            # Rows for every view were prebuilt alongside the indices
+            self._view_cache = indices["view_cache"]
+            self._artist_name_by_id = indices["artist_name_by_id"]
+            self._sorted_entries = indices["sorted_entries"]
+            self._counts = indices["counts"]
+
+            if self.library_data:
+                data_keys = list(self.library_data.keys())[:5]  # Show first 5 keys
+                summary = f"Library loaded. Sections: {', '.join(data_keys)}"
+            else:
+                summary = "Library loaded. No data structure available yet."
+            self._status_text = summary
+            if self._status_widget is not None:
+                self._status_widget.update(summary)
+            # Repopulate the existing table in place; nothing else changed
+            self._refresh_table()
+        else:
+            message = result.get("message", "Unknown error")
+            self.notify(f"Failed to load library: {message}", severity="error")
+
+            # Show discovery info if available
+            if "discovered" in result:
+                discovery = result["discovered"]
+                if discovery.get("status") == "success":
+                    available_endpoints = [ep for ep, info in discovery["endpoints"].items() if info.get("available")]
+                    if available_endpoints:
+                        self.notify(f"Available endpoints found: {', '.join(available_endpoints)}", severity="information")
+
     def on_mount(self) -> None:
         """Called when the app starts."""
-        if not settings.validate():
-            self.notify("Username and password not configured. Check .env file.", severity="warning")
\ No newline at end of file
+        self._status_widget = self.query_one("#welcome", Static)
+        self._view_header_widget = self.query_one(".view-header", Static)
+        self._table = self.query_one("#library-table", DataTable)
+        if not self._settings_valid:
+            self.notify("Username and password not configured. Check .env file.", severity="warning")
+        else:
+            # Show the previous session's library immediately; connecting
+            # replaces it with a fresh fetch.
+            self._load_snapshot()
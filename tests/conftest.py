@@ -0,0 +1,16 @@
+"""Shared fixtures for the test suite."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ibroadcast_tui.api.client import iBroadcastClient
+
+@pytest.fixture
+def api_client() -> iBroadcastClient:
+    """An iBroadcastClient constructed with its httpx client mocked out."""
+    # Patch only around construction so tests can still build real httpx
+    # clients (e.g. with MockTransport) afterwards
+    with patch('ibroadcast_tui.api.client.httpx.Client'):
+        client = iBroadcastClient()
+    yield client
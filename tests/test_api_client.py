@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock, patch
 
+import httpx
+
 from ibroadcast_tui.api.client import iBroadcastClient
 
 class TestiBroadcastClient:
@@ -14,34 +16,27 @@ class TestiBroadcastClient:
         assert client.base_url == "https://api.ibroadcast.com"
         mock_client.assert_called_once()
     
-    def test_authenticate_missing_credentials(self) -> None:
+    def test_authenticate_missing_credentials(self, api_client: iBroadcastClient) -> None:
         """Test authentication with missing credentials."""
-        # Create client with missing credentials
-        client = iBroadcastClient()
+        # Client from the shared fixture; clear credentials
+        client = api_client
         client.username = None
         client.password = None
         result = client._login()
         assert result["status"] == "error"
         assert "Missing username or password" in result["message"]
     
-    @patch('ibroadcast_tui.api.client.httpx')
-    def test_login_success(self, mock_httpx: Mock) -> None:
+    def test_login_success(self, api_client: iBroadcastClient) -> None:
         """Test successful login."""
-        # Mock successful login response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "user": {
-                "id": "12345",
-                "token": "test_token"
-            }
-        }
-        mock_response.raise_for_status.return_value = None
-
-        mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_httpx.Client.return_value = mock_client_instance
+        # Mock at the transport layer so the real httpx request/response
+        # machinery (and the JSON decode path) is exercised
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"user": {"id": "12345", "token": "test_token"}})
 
-        client = iBroadcastClient()
+        client = api_client
+        client.client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
         client.username = "test@example.com"
         client.password = "test_password"
 
@@ -50,3 +45,24 @@ class TestiBroadcastClient:
         assert result["status"] == "success"
         assert client.user_id == "12345"
         assert client.token == "test_token"
+
+    @patch('ibroadcast_tui.api.client.time.time', return_value=1_000_000.0)
+    def test_stream_url_signing(self, mock_time: Mock, api_client: iBroadcastClient) -> None:
+        """Test batched stream-URL signing and single-track delegation."""
+        client = api_client
+        client.token = "test_token"
+        client.user_id = "12345"
+
+        urls = client.get_stream_urls([("1", "/f/a.mp3"), ("2", "/f/b.mp3")])
+
+        assert urls[0] == (
+            "https://streaming.ibroadcast.com/f/a.mp3"
+            "?Expires=1003600&Signature=test_token&user_id=12345&file_id=1"
+        )
+        # One expiry/signature computed for the whole batch
+        signatures = [url.split("?", 1)[1].rsplit("&", 1)[0] for url in urls]
+        assert signatures[0] == signatures[1]
+        assert urls[1].endswith("&file_id=2")
+
+        # Single-track variant delegates to the batch builder
+        assert client.get_stream_url("1", "/f/a.mp3") == urls[0]
@@ -0,0 +1,59 @@
+"""Tests for the library snapshot cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from ibroadcast_tui.config.library_cache import LibraryCache
+
+class TestLibraryCache:
+    """Test cases for library snapshot persistence."""
+
+    @patch('ibroadcast_tui.config.library_cache.Path.home')
+    @patch('ibroadcast_tui.config.library_cache.settings')
+    def test_save_and_load_snapshot(self, mock_settings, mock_home, tmp_path: Path) -> None:
+        """Test saving and loading a library snapshot."""
+        mock_home.return_value = tmp_path
+        mock_settings.username = "test@example.com"
+
+        cache = LibraryCache()
+        library = {"tracks": {"1": ["a"]}, "albums": {}}
+
+        cache.save(library)
+        loaded = cache.load()
+
+        assert loaded == library
+
+    @patch('ibroadcast_tui.config.library_cache.Path.home')
+    @patch('ibroadcast_tui.config.library_cache.settings')
+    def test_load_rejects_other_user(self, mock_settings, mock_home, tmp_path: Path) -> None:
+        """Test that a snapshot saved by another user is not loaded."""
+        mock_home.return_value = tmp_path
+        mock_settings.username = "user1@example.com"
+
+        cache = LibraryCache()
+        cache.save({"tracks": {}})
+
+        mock_settings.username = "user2@example.com"
+        assert cache.load() is None
+
+    @patch('ibroadcast_tui.config.library_cache.Path.home')
+    def test_load_missing_snapshot(self, mock_home, tmp_path: Path) -> None:
+        """Test loading when no snapshot exists."""
+        mock_home.return_value = tmp_path
+
+        cache = LibraryCache()
+        assert cache.load() is None
+
+    @patch('ibroadcast_tui.config.library_cache.Path.home')
+    def test_load_deletes_corrupt_snapshot(self, mock_home, tmp_path: Path) -> None:
+        """Test that a corrupt snapshot is dropped instead of raised."""
+        mock_home.return_value = tmp_path
+
+        cache = LibraryCache()
+        cache.cache_dir.mkdir(mode=0o700, exist_ok=True)
+        # References a module that cannot be imported, so unpickling raises
+        # ModuleNotFoundError rather than UnpicklingError
+        cache.cache_file.write_bytes(b"\x80\x05\x95\x10\x00\x00\x00\x00\x00\x00\x00\x8c\x07no_such\x8c\x04name\x93.")
+
+        assert cache.load() is None
+        assert not cache.cache_file.exists()
@@ -3,18 +3,20 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
 from ibroadcast_tui.config.settings import Settings
 
 class TestSettings:
     """Test cases for settings configuration."""
-    
+
     def test_default_settings(self) -> None:
         """Test default settings values."""
         test_settings = Settings()
         assert test_settings.api_url == "https://api.ibroadcast.com"
         assert test_settings.app_name == "iBroadcast TUI"
         assert test_settings.debug is False
-    
+
     @patch.dict(os.environ, {
         'IBROADCAST_API_URL': 'https://test.api.com',
         'DEBUG': 'true'
@@ -24,21 +26,16 @@ class TestSettings:
         test_settings = Settings()
         assert test_settings.api_url == 'https://test.api.com'
         assert test_settings.debug is True
-    
-    @patch.dict(os.environ, {}, clear=True)
-    def test_validate_missing_credentials(self) -> None:
-        """Test validation with missing credentials."""
-        test_settings = Settings()
-        # Manually set to None to simulate missing environment variables
-        test_settings.client_id = None
-        test_settings.client_secret = None
-        assert test_settings.validate() is False
-    
-    @patch.dict(os.environ, {
-        'IBROADCAST_USERNAME': 'test@example.com',
-        'IBROADCAST_PASSWORD': 'test_password'
-    })
-    def test_validate_with_credentials(self) -> None:
-        """Test validation with all credentials present."""
-        test_settings = Settings()
-        assert test_settings.validate() is True
+
+    @pytest.mark.parametrize("env,expected", [
+        ({'IBROADCAST_USERNAME': 'test@example.com',
+          'IBROADCAST_PASSWORD': 'test_password'}, True),
+        ({}, False),
+        ({'IBROADCAST_USERNAME': 'your_username_here',
+          'IBROADCAST_PASSWORD': 'your_password_here'}, False),
+    ])
+    def test_validate(self, env: dict, expected: bool) -> None:
+        """Test credential validation across present, missing and placeholder values."""
+        with patch.dict(os.environ, env, clear=True):
+            test_settings = Settings()
+            assert test_settings.validate() is expected
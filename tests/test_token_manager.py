@@ -1,6 +1,5 @@
 """Tests for token manager."""
 
-import tempfile
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -10,31 +9,21 @@ from ibroadcast_tui.config.token_manager import TokenManager
 class TestTokenManager:
     """Test cases for token management."""
     
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.token_file = self.temp_dir / "token.json"
-    
-    def teardown_method(self) -> None:
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     @patch('ibroadcast_tui.config.token_manager.Path.home')
-    def test_token_manager_initialization(self, mock_home: patch) -> None:
+    def test_token_manager_initialization(self, mock_home: patch, tmp_path: Path) -> None:
         """Test token manager creates directory correctly."""
-        mock_home.return_value = self.temp_dir
+        mock_home.return_value = tmp_path
         
         token_manager = TokenManager()
         
-        assert token_manager.token_dir == self.temp_dir / ".ibroadcast-tui"
+        assert token_manager.token_dir == tmp_path / ".ibroadcast-tui"
         assert token_manager.token_file == token_manager.token_dir / "token.json"
     
     @patch('ibroadcast_tui.config.token_manager.Path.home')
     @patch('ibroadcast_tui.config.token_manager.settings')
-    def test_save_and_load_token(self, mock_settings: Mock, mock_home: patch) -> None:
+    def test_save_and_load_token(self, mock_settings: Mock, mock_home: patch, tmp_path: Path) -> None:
         """Test saving and loading token."""
-        mock_home.return_value = self.temp_dir
+        mock_home.return_value = tmp_path
         mock_settings.username = "test@example.com"
 
         token_manager = TokenManager()
@@ -56,9 +45,9 @@ class TestTokenManager:
         assert "expires_at" in loaded_token
     
     @patch('ibroadcast_tui.config.token_manager.Path.home')
-    def test_token_validation(self, mock_home: patch) -> None:
+    def test_token_validation(self, mock_home: patch, tmp_path: Path) -> None:
         """Test token validation."""
-        mock_home.return_value = self.temp_dir
+        mock_home.return_value = tmp_path
         
         token_manager = TokenManager()
         
@@ -86,9 +75,9 @@ class TestTokenManager:
         assert token_manager.is_token_valid() is False
     
     @patch('ibroadcast_tui.config.token_manager.Path.home')
-    def test_client_id_validation(self, mock_home: patch) -> None:
+    def test_client_id_validation(self, mock_home: patch, tmp_path: Path) -> None:
         """Test token validation with different client IDs."""
-        mock_home.return_value = self.temp_dir
+        mock_home.return_value = tmp_path
         
         token_manager = TokenManager()
         
@@ -106,9 +95,9 @@ class TestTokenManager:
             assert loaded_token is None  # Should not load token for different client
     
     @patch('ibroadcast_tui.config.token_manager.Path.home')
-    def test_delete_token(self, mock_home: patch) -> None:
+    def test_delete_token(self, mock_home: patch, tmp_path: Path) -> None:
         """Test token deletion."""
-        mock_home.return_value = self.temp_dir
+        mock_home.return_value = tmp_path
         
         token_manager = TokenManager()
         token_data = {"access_token": "test_token"}